@@ -3,6 +3,7 @@ from flask_sqlalchemy import SQLAlchemy
 from flask_migrate import Migrate
 from flask_cors import CORS
 from flask_bcrypt import Bcrypt
+from flask_caching import Cache
 from flasgger import Swagger
 from config import config
 
@@ -10,6 +11,7 @@ from config import config
 db = SQLAlchemy()
 migrate = Migrate()
 bcrypt = Bcrypt()
+cache = Cache()
 swagger = Swagger()
 
 def create_app(config_name):
@@ -17,10 +19,29 @@ def create_app(config_name):
     app = Flask(__name__)
     app.config.from_object(config[config_name])
 
+    from .json_provider import OrjsonProvider
+    app.json = OrjsonProvider(app)
+
     # Initialize extensions with app
     db.init_app(app)
     migrate.init_app(app, db)
     bcrypt.init_app(app)
+    cache.init_app(app)
+
+    if app.config['ASYNC_ADMIN_LOGS']:
+        from redis import Redis
+        from rq import Queue
+        app.extensions['admin_log_queue'] = Queue('admin_logs', connection=Redis.from_url(app.config['REDIS_URL']))
+
+    # In development, report lazy loads that should have been eager loads
+    # (install nplusone to enable)
+    if app.debug:
+        try:
+            from nplusone.ext.flask_sqlalchemy import NPlusOne
+        except ImportError:
+            pass
+        else:
+            NPlusOne(app)
     
     # This line is critical. It tells your backend to accept API requests
     # from your frontend servers, both local and deployed.
@@ -0,0 +1,47 @@
+# app/audit.py
+from datetime import datetime
+
+from flask import current_app, g, has_app_context
+from redis.exceptions import RedisError
+from sqlalchemy import event
+
+from .models import db, AdminLog
+from .tasks import record_admin_logs
+
+
+def audit(admin_id, action):
+    """Queue an admin log entry to be written once the request's changes are committed."""
+    log = AdminLog(admin_id=admin_id, action=action, timestamp=datetime.utcnow())
+    g.setdefault('_pending_logs', []).append(log)
+
+
+def _admin_log_queue():
+    return current_app.extensions.get('admin_log_queue') if has_app_context() else None
+
+
+@event.listens_for(db.session, 'before_commit')
+def _flush_pending_logs(session):
+    """Write all queued admin logs in one bulk INSERT inside the committing transaction."""
+    if not has_app_context() or _admin_log_queue() is not None:
+        return
+    pending_logs = g.pop('_pending_logs', None)
+    if pending_logs:
+        session.bulk_save_objects(pending_logs)
+
+
+@event.listens_for(db.session, 'after_commit')
+def _enqueue_pending_logs(session):
+    """Hand queued admin logs to the worker once the change they describe is committed."""
+    queue = _admin_log_queue()
+    if queue is None:
+        return
+    pending_logs = g.pop('_pending_logs', None)
+    if not pending_logs:
+        return
+    entries = [(log.admin_id, log.action, log.timestamp) for log in pending_logs]
+    try:
+        queue.enqueue(record_admin_logs, entries)
+    except RedisError:
+        # Don't lose the audit trail if Redis is unavailable
+        current_app.logger.exception("Could not queue admin logs, writing them directly")
+        record_admin_logs(entries)
@@ -1,17 +1,27 @@
 import jwt
 from datetime import datetime, timedelta
 from functools import wraps
-from flask import Blueprint, request, jsonify, current_app
+from typing import NamedTuple
+from flask import Blueprint, request, jsonify, current_app, g
 # Add the Google Auth library
 from google.oauth2 import id_token
 from google.auth.transport import requests as google_requests
 
+from sqlalchemy import select
+
 from .models import User, db
-from .schemas import UserSchema
+from .schemas import user_schema
 from marshmallow import ValidationError
 
 auth = Blueprint('auth', __name__)
-user_schema = UserSchema()
+
+
+class CurrentUser(NamedTuple):
+    """The authenticated user passed to views; only the columns they read."""
+    id: int
+    is_admin: bool
+    username: str
+
 
 # --- Existing token_required and admin_required functions remain the same ---
 
@@ -28,16 +38,27 @@ def token_required(f):
         if not token:
             return jsonify({'message': 'Token is missing!'}), 401
 
+        # Reuse the user already resolved from this token earlier in the request
+        cached = g.get('_current_user')
+        if cached and cached[0] == token:
+            return f(cached[1], *args, **kwargs)
+
         try:
             data = jwt.decode(token, current_app.config['SECRET_KEY'], algorithms=["HS256"])
-            current_user = User.query.get(data['user_id'])
-            if not current_user:
+            # Still hit the database so deleted users and revoked admin rights take effect
+            # immediately, but without building a full User entity
+            row = db.session.execute(
+                select(User.id, User.is_admin, User.username).where(User.id == data['user_id'])
+            ).first()
+            if not row:
                 return jsonify({'message': 'User not found'}), 401
+            current_user = CurrentUser(*row)
         except jwt.ExpiredSignatureError:
             return jsonify({'message': 'Token has expired'}), 401
         except jwt.InvalidTokenError:
             return jsonify({'message': 'Token is invalid!'}), 401
 
+        g._current_user = (token, current_user)
         return f(current_user, *args, **kwargs)
     return decorated
     
@@ -77,7 +98,11 @@ def signup():
     except ValidationError as err:
         return jsonify(err.messages), 400
         
-    if User.query.filter_by(username=data['username']).first() or User.query.filter_by(email=data['email']).first():
+    # One EXISTS query covers both uniqueness checks without loading a User
+    taken = db.session.query(
+        User.query.filter((User.username == data['username']) | (User.email == data['email'])).exists()
+    ).scalar()
+    if taken:
         return jsonify({"message": "User already exists"}), 400
 
     new_user = User(
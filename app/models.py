@@ -1,5 +1,6 @@
 from . import db
 from datetime import datetime
+from sqlalchemy import event, update
 from app import bcrypt
 
 class CaseUser(db.Model):
@@ -31,6 +32,12 @@ class User(db.Model):
 
 class Report(db.Model):
     __tablename__ = 'report'
+    __table_args__ = (
+        # Serves the newest-first ordering used by the paginated report list
+        db.Index('ix_report_date_of_incident_id', 'date_of_incident', 'id'),
+        # Serves a user's own reports, newest first
+        db.Index('ix_report_user_id_date_of_incident', 'user_id', 'date_of_incident'),
+    )
     id = db.Column(db.Integer, primary_key=True)
     title = db.Column(db.String(150), nullable=False)
     description = db.Column(db.Text, nullable=False)
@@ -48,7 +55,8 @@ class NewsArticle(db.Model):
     content = db.Column(db.Text, nullable=False)
     source = db.Column(db.String(100))
     read_more_link = db.Column(db.String(500), nullable=True)
-    published_date = db.Column(db.DateTime, default=datetime.utcnow)
+    published_date = db.Column(db.DateTime, default=datetime.utcnow, index=True)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, index=True)
     
     author_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=True)
 
@@ -66,4 +74,32 @@ class AdminLog(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     action = db.Column(db.String(255), nullable=False)
     timestamp = db.Column(db.DateTime, default=datetime.utcnow)
-    admin_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
\ No newline at end of file
+    admin_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
+
+class Stat(db.Model):
+    """Running row counts (e.g. reports_count), so summaries don't need COUNT(*)."""
+    __tablename__ = 'stat'
+    key = db.Column(db.String(50), primary_key=True)
+    value = db.Column(db.Integer, nullable=False, default=0)
+
+def adjust_stat(executor, key, delta):
+    """Add delta to a Stat row using a session or connection, inside its transaction."""
+    executor.execute(update(Stat).where(Stat.key == key).values(value=Stat.value + delta))
+
+# Keep the counts in step with ORM inserts/deletes. Bulk DELETE statements
+# bypass these hooks and must call adjust_stat themselves.
+@event.listens_for(Report, 'after_insert')
+def _report_inserted(mapper, connection, target):
+    adjust_stat(connection, 'reports_count', 1)
+
+@event.listens_for(Report, 'after_delete')
+def _report_deleted(mapper, connection, target):
+    adjust_stat(connection, 'reports_count', -1)
+
+@event.listens_for(NewsArticle, 'after_insert')
+def _news_article_inserted(mapper, connection, target):
+    adjust_stat(connection, 'news_count', 1)
+
+@event.listens_for(NewsArticle, 'after_delete')
+def _news_article_deleted(mapper, connection, target):
+    adjust_stat(connection, 'news_count', -1)
\ No newline at end of file
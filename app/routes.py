@@ -1,21 +1,65 @@
 # app/routes.py
 
-from flask import Blueprint, request, jsonify
-from .models import db, Report, NewsArticle, User, AdminLog
-from .schemas import ReportSchema, NewsArticleSchema, UserSchema
+import hashlib
+
+import orjson
+from flask import Blueprint, Response, current_app, request, jsonify, abort, stream_with_context
+from redis.exceptions import RedisError
+from sqlalchemy import select, update, delete, func
+from sqlalchemy.orm import joinedload, load_only
+from werkzeug.http import is_resource_modified
+from . import cache
+from .models import db, Report, NewsArticle, User, Stat, adjust_stat
+from .audit import audit
+from .schemas import (
+    report_schema, reports_schema, new_report_schema, news_article_schema, news_articles_schema, users_schema,
+    validate_new_report
+)
 from .auth import token_required, admin_required
 from marshmallow import ValidationError
+from fastjsonschema import JsonSchemaValueException
 
 api = Blueprint('api', __name__)
 
-report_schema = ReportSchema()
-reports_schema = ReportSchema(many=True)
-news_article_schema = NewsArticleSchema()
-news_articles_schema = NewsArticleSchema(many=True)
-user_schema = UserSchema()
-users_schema = UserSchema(many=True)
+# Cache key for the home page counts; cleared whenever a report or article is added or removed
+HOME_SUMMARY_CACHE_KEY = 'home_summary'
+
+# Cache-Control for responses that proxies/CDNs may share, and for
+# per-user responses that only the client's own cache may keep
+PUBLIC_CACHE_CONTROL = 'public, max-age=60, stale-while-revalidate=30'
+PRIVATE_CACHE_CONTROL = 'private, max-age=15'
+
+# Pagination for the public list endpoints
+DEFAULT_PAGE_SIZE = 25
+MAX_PAGE_SIZE = 100
+
+# Keyset pagination for the admin user list
+DEFAULT_USER_PAGE_SIZE = 50
+MAX_USER_PAGE_SIZE = 200
+
+# Rows fetched per database round trip when streaming a list response
+STREAM_BATCH_SIZE = 500
+
+def invalidate_home_summary():
+    """Drop the cached home counts after a committed write.
+
+    Best effort: the write has already succeeded, so a cache outage must not
+    turn it into an error (and a client retry into a duplicate). A missed
+    delete only leaves the counts stale until the cache timeout.
+    """
+    try:
+        cache.delete(HOME_SUMMARY_CACHE_KEY)
+    except RedisError:
+        current_app.logger.exception("Could not invalidate the cached home summary")
+
+def page_args():
+    """Read ?page= and ?per_page= from the request, clamped to sane bounds."""
+    page = max(request.args.get('page', 1, type=int), 1)
+    per_page = max(1, min(request.args.get('per_page', DEFAULT_PAGE_SIZE, type=int), MAX_PAGE_SIZE))
+    return page, per_page
 
 @api.route('/home_summary', methods=['GET'])
+@cache.cached(key_prefix=HOME_SUMMARY_CACHE_KEY)
 def home_summary():
     """
     Get a summary of home page data.
@@ -33,12 +77,16 @@ def home_summary():
                     newsCount:
                         type: integer
     """
-    reports_count = Report.query.count()
-    news_count = NewsArticle.query.count()
-    return jsonify({
-        "reportsCount": reports_count,
-        "newsCount": news_count
+    # Counts are maintained in the stat table, so this is a primary-key lookup
+    stats = dict(db.session.execute(
+        select(Stat.key, Stat.value).where(Stat.key.in_(['reports_count', 'news_count']))
+    ).all())
+    response = jsonify({
+        "reportsCount": stats.get('reports_count', 0),
+        "newsCount": stats.get('news_count', 0)
     })
+    response.headers['Cache-Control'] = PUBLIC_CACHE_CONTROL
+    return response
 
 @api.route('/reports', methods=['POST'])
 @token_required
@@ -63,21 +111,27 @@ def create_report(current_user):
       401:
         description: Unauthorized.
     """
-    json_data = request.get_json()
+    data = request.get_json()
     try:
-        data = report_schema.load(json_data)
-    except ValidationError as err:
-        return jsonify(err.messages), 400
+        validate_new_report(data)
+    except JsonSchemaValueException as err:
+        return jsonify({"message": err.message}), 400
     new_report = Report(
         title=data['title'],
         description=data['description'],
         location=data.get('location'),
         is_anonymous=data.get('is_anonymous', False),
-        author=current_user
+        user_id=current_user.id
     )
     db.session.add(new_report)
+    # Flush once for the new ID and serialize before commit expires the
+    # instance, taking the author's name from the authenticated user
+    db.session.flush()
+    result = new_report_schema.dump(new_report)
+    result['author_username'] = current_user.username
     db.session.commit()
-    return jsonify(report_schema.dump(new_report)), 201
+    invalidate_home_summary()
+    return jsonify(result), 201
 
 @api.route('/reports', methods=['GET'])
 @token_required
@@ -89,18 +143,46 @@ def get_reports(current_user):
       - Reports
     security:
       - Bearer: []
+    parameters:
+      - name: page
+        in: query
+        type: integer
+        default: 1
+      - name: per_page
+        in: query
+        type: integer
+        default: 25
+        description: Page size, capped at 100.
     responses:
       200:
-        description: A list of reports.
+        description: A page of reports.
         schema:
-          type: array
-          items:
-            $ref: '#/definitions/Report'
+          type: object
+          properties:
+            items:
+              type: array
+              items:
+                $ref: '#/definitions/Report'
+            next:
+              type: integer
+              description: Number of the next page, or null on the last page.
       401:
         description: Unauthorized.
     """
-    all_reports = Report.query.order_by(Report.date_of_incident.desc()).all()
-    return jsonify(reports_schema.dump(all_reports)), 200
+    query = Report.query.options(joinedload(Report.author))
+    # Fetch one extra row to learn whether a next page exists without counting the table
+    page, per_page = page_args()
+    reports = (
+        query.order_by(Report.date_of_incident.desc(), Report.id.desc())
+        .limit(per_page + 1)
+        .offset((page - 1) * per_page)
+        .all()
+    )
+    next_page = page + 1 if len(reports) > per_page else None
+    response = jsonify({"items": reports_schema.dump(reports[:per_page]), "next": next_page})
+    response.headers['Cache-Control'] = PRIVATE_CACHE_CONTROL
+    response.vary.add('Authorization')
+    return response
 
 # New endpoint for user-specific reports
 @api.route('/my_reports', methods=['GET'])
@@ -123,8 +205,22 @@ def get_my_reports(current_user):
       401:
         description: Unauthorized.
     """
-    user_reports = Report.query.filter_by(user_id=current_user.id).order_by(Report.date_of_incident.desc()).all()
-    return jsonify(reports_schema.dump(user_reports)), 200
+    query = Report.query.options(joinedload(Report.author)).filter_by(user_id=current_user.id)
+    user_reports = query.order_by(Report.date_of_incident.desc()).yield_per(STREAM_BATCH_SIZE)
+
+    # Stream the JSON array row by row instead of building the whole list in memory
+    def generate():
+        yield b'['
+        for i, report in enumerate(user_reports):
+            if i:
+                yield b','
+            yield orjson.dumps(report_schema.dump(report))
+        yield b']'
+
+    response = Response(stream_with_context(generate()), mimetype='application/json')
+    response.headers['Cache-Control'] = PRIVATE_CACHE_CONTROL
+    response.vary.add('Authorization')
+    return response
 
 @api.route('/news', methods=['GET'])
 def get_news_articles():
@@ -133,16 +229,59 @@ def get_news_articles():
     ---
     tags:
       - News
+    parameters:
+      - name: page
+        in: query
+        type: integer
+        default: 1
+      - name: per_page
+        in: query
+        type: integer
+        default: 25
+        description: Page size, capped at 100.
     responses:
       200:
-        description: A list of news articles.
+        description: A page of news articles.
         schema:
-          type: array
-          items:
-            $ref: '#/definitions/NewsArticle'
+          type: object
+          properties:
+            items:
+              type: array
+              items:
+                $ref: '#/definitions/NewsArticle'
+            next:
+              type: integer
+              description: Number of the next page, or null on the last page.
+      304:
+        description: Not modified since the client's cached copy.
     """
-    articles = NewsArticle.query.order_by(NewsArticle.published_date.desc()).all()
-    return jsonify(news_articles_schema.dump(articles)), 200
+    # Any create, edit or delete moves the latest updated_at or the row count,
+    # so together they validate the client's copy without loading the articles.
+    # Only the ETag is used: MAX(updated_at) alone doesn't change when an older
+    # article is deleted, so it can't back Last-Modified/If-Modified-Since.
+    latest_update, article_count = db.session.execute(
+        select(func.max(NewsArticle.updated_at), func.count()).select_from(NewsArticle)
+    ).one()
+    etag = hashlib.md5(f"{latest_update}-{article_count}".encode()).hexdigest()
+
+    if not is_resource_modified(request.environ, etag=etag):
+        response = Response(status=304)
+    else:
+        # The count from the ETag query decides whether there is a next page,
+        # so no second COUNT is needed
+        page, per_page = page_args()
+        articles = (
+            NewsArticle.query
+            .order_by(NewsArticle.published_date.desc(), NewsArticle.id.desc())
+            .limit(per_page)
+            .offset((page - 1) * per_page)
+            .all()
+        )
+        next_page = page + 1 if page * per_page < article_count else None
+        response = jsonify({"items": news_articles_schema.dump(articles), "next": next_page})
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = PUBLIC_CACHE_CONTROL
+    return response
 
 # Admin - News Management
 @api.route('/admin/news', methods=['POST'])
@@ -186,11 +325,15 @@ def create_news_article(current_user):
     db.session.add(new_article)
     
     # Log the action
-    log = AdminLog(admin_id=current_user.id, action=f"Created news article: {data['title']}")
-    db.session.add(log)
+    audit(current_user.id, f"Created news article: {data['title']}")
+    # Flush once for the new ID and serialize before commit expires the
+    # instance, so the response needs no SELECT to reload it
+    db.session.flush()
+    result = news_article_schema.dump(new_article)
     db.session.commit()
+    invalidate_home_summary()
     
-    return jsonify(news_article_schema.dump(new_article)), 201
+    return jsonify(result), 201
 
 @api.route('/admin/news/<int:id>', methods=['PUT'])
 @admin_required
@@ -224,25 +367,29 @@ def update_news_article(current_user, id):
       404:
         description: News article not found.
     """
-    article = NewsArticle.query.get_or_404(id)
     json_data = request.get_json()
     
     try:
         data = news_article_schema.load(json_data, partial=True)
     except ValidationError as err:
         return jsonify(err.messages), 400
+    if not data:
+        return jsonify({"message": "No input data provided"}), 400
     
-    article.title = data.get('title', article.title)
-    article.content = data.get('content', article.content)
-    article.source = data.get('source', article.source)
-    article.read_more_link = data.get('read_more_link', article.read_more_link)
+    # Update and read back the row in one statement
+    article = db.session.execute(
+        update(NewsArticle).where(NewsArticle.id == id).values(**data).returning(NewsArticle)
+    ).scalar()
+    if article is None:
+        abort(404)
     
     # Log the action
-    log = AdminLog(admin_id=current_user.id, action=f"Updated news article ID {id}: {article.title}")
-    db.session.add(log)
+    audit(current_user.id, f"Updated news article ID {id}: {article.title}")
+    # Serialize before commit so the expired instance isn't reloaded
+    result = news_article_schema.dump(article)
     db.session.commit()
     
-    return jsonify(news_article_schema.dump(article)), 200
+    return jsonify(result), 200
 
 @api.route('/admin/news/<int:id>', methods=['DELETE'])
 @admin_required
@@ -270,15 +417,17 @@ def delete_news_article(current_user, id):
       404:
         description: News article not found.
     """
-    article = NewsArticle.query.get_or_404(id)
-    article_title = article.title
-    
-    db.session.delete(article)
+    article_title = db.session.execute(
+        delete(NewsArticle).where(NewsArticle.id == id).returning(NewsArticle.title)
+    ).scalar()
+    if article_title is None:
+        abort(404)
+    adjust_stat(db.session, 'news_count', -1)
     
     # Log the action
-    log = AdminLog(admin_id=current_user.id, action=f"Deleted news article ID {id}: {article_title}")
-    db.session.add(log)
+    audit(current_user.id, f"Deleted news article ID {id}: {article_title}")
     db.session.commit()
+    invalidate_home_summary()
     
     return jsonify({"message": f"News article '{article_title}' has been deleted"}), 200
 
@@ -293,20 +442,47 @@ def get_all_users(current_user):
       - Admin
     security:
       - Bearer: []
+    parameters:
+      - name: after
+        in: query
+        type: integer
+        default: 0
+        description: Return users with an ID greater than this (the previous page's next_after).
+      - name: limit
+        in: query
+        type: integer
+        default: 50
+        description: Page size, capped at 200.
     responses:
       200:
-        description: A list of users.
+        description: A page of users ordered by ID.
         schema:
-          type: array
-          items:
-            $ref: '#/definitions/User'
+          type: object
+          properties:
+            items:
+              type: array
+              items:
+                $ref: '#/definitions/User'
+            next_after:
+              type: integer
+              description: Value for the next page's after parameter, or null on the last page.
       401:
         description: Unauthorized.
       403:
         description: Forbidden, admin access required.
     """
-    users = User.query.all()
-    return jsonify(users_schema.dump(users)), 200
+    after = request.args.get('after', 0, type=int)
+    limit = max(1, min(request.args.get('limit', DEFAULT_USER_PAGE_SIZE, type=int), MAX_USER_PAGE_SIZE))
+    users = (
+        User.query
+        .options(load_only(User.id, User.username, User.email, User.is_admin))
+        .filter(User.id > after)
+        .order_by(User.id)
+        .limit(limit)
+        .all()
+    )
+    next_after = users[-1].id if len(users) == limit else None
+    return jsonify({"items": users_schema.dump(users), "next_after": next_after}), 200
 
 # Admin - Report Management
 @api.route('/admin/reports/verify/<int:id>', methods=['PUT'])
@@ -335,10 +511,12 @@ def verify_report(current_user, id):
       404:
         description: Report not found.
     """
-    report = Report.query.get_or_404(id)
-    report.status = "Verified"
-    log = AdminLog(admin_id=current_user.id, action=f"Verified report ID {id}: {report.title}")
-    db.session.add(log)
+    report_title = db.session.execute(
+        update(Report).where(Report.id == id).values(status="Verified").returning(Report.title)
+    ).scalar()
+    if report_title is None:
+        abort(404)
+    audit(current_user.id, f"Verified report ID {id}: {report_title}")
     db.session.commit()
     return jsonify({"message": f"Report {id} has been verified"}), 200
 
@@ -368,9 +546,11 @@ def reject_report(current_user, id):
       404:
         description: Report not found.
     """
-    report = Report.query.get_or_404(id)
-    report.status = "Rejected"
-    log = AdminLog(admin_id=current_user.id, action=f"Rejected report ID {id}: {report.title}")
-    db.session.add(log)
+    report_title = db.session.execute(
+        update(Report).where(Report.id == id).values(status="Rejected").returning(Report.title)
+    ).scalar()
+    if report_title is None:
+        abort(404)
+    audit(current_user.id, f"Rejected report ID {id}: {report_title}")
     db.session.commit()
     return jsonify({"message": f"Report {id} has been rejected"}), 200
\ No newline at end of file
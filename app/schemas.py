@@ -1,3 +1,4 @@
+import fastjsonschema
 from marshmallow import Schema, fields, validate
 
 class UserSchema(Schema):
@@ -18,6 +19,20 @@ class ReportSchema(Schema):
     user_id = fields.Int(dump_only=True)
     author_username = fields.Str(attribute="author.username", dump_only=True)
 
+# Compiled validator for new reports, matching ReportSchema's load rules.
+# Used on the create path in place of ReportSchema.load.
+validate_new_report = fastjsonschema.compile({
+    "type": "object",
+    "required": ["title", "description"],
+    "properties": {
+        "title": {"type": "string", "maxLength": 150},
+        "description": {"type": "string"},
+        "location": {"type": "string", "maxLength": 200},
+        "is_anonymous": {"type": "boolean"}
+    },
+    "additionalProperties": False
+})
+
 class NewsArticleSchema(Schema):
     id = fields.Int(dump_only=True)
     title = fields.Str(required=True, validate=validate.Length(max=200))
@@ -35,4 +50,15 @@ class CaseSchema(Schema):
 class CaseUserSchema(Schema):
     user_id = fields.Int(required=True)
     case_id = fields.Int(dump_only=True)
-    role = fields.Str(required=True, validate=validate.Length(max=50))
\ No newline at end of file
+    role = fields.Str(required=True, validate=validate.Length(max=50))
+
+# Shared schema instances; built once at import and reused by every request
+user_schema = UserSchema()
+users_schema = UserSchema(many=True)
+report_schema = ReportSchema()
+# For a report just created by the current user; the view fills in author_username
+# itself so dumping doesn't lazy-load the author
+new_report_schema = ReportSchema(exclude=('author_username',))
+reports_schema = ReportSchema(many=True)
+news_article_schema = NewsArticleSchema()
+news_articles_schema = NewsArticleSchema(many=True)
\ No newline at end of file
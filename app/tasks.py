@@ -0,0 +1,31 @@
+# app/tasks.py
+import os
+from contextlib import nullcontext
+
+from flask import has_app_context
+from sqlalchemy import insert
+
+from . import create_app, db
+from .models import AdminLog
+
+_worker_app = None
+
+
+def _worker_app_context():
+    """Build the app once per worker process and return a context for it."""
+    global _worker_app
+    if _worker_app is None:
+        _worker_app = create_app(os.getenv('FLASK_CONFIG') or 'default')
+    return _worker_app.app_context()
+
+
+def record_admin_logs(entries):
+    """Insert (admin_id, action, timestamp) admin log entries in one statement.
+
+    Enqueued by app.audit and run by an RQ worker (`rq worker admin_logs`).
+    """
+    rows = [{'admin_id': admin_id, 'action': action, 'timestamp': timestamp}
+            for admin_id, action, timestamp in entries]
+    with nullcontext() if has_app_context() else _worker_app_context():
+        with db.engine.begin() as connection:
+            connection.execute(insert(AdminLog), rows)
@@ -9,6 +9,15 @@ class Config:
     SECRET_KEY = os.environ.get('SECRET_KEY') or 'you-will-never-guess'
     SQLALCHEMY_TRACK_MODIFICATIONS = False
 
+    # Caching: Redis when REDIS_URL is set, otherwise a per-process cache
+    REDIS_URL = os.environ.get('REDIS_URL')
+    CACHE_TYPE = 'RedisCache' if REDIS_URL else 'SimpleCache'
+    CACHE_REDIS_URL = REDIS_URL
+    CACHE_DEFAULT_TIMEOUT = 30
+
+    # Write admin logs from an RQ worker (`rq worker admin_logs`) instead of in the request
+    ASYNC_ADMIN_LOGS = bool(REDIS_URL) and os.environ.get('ASYNC_ADMIN_LOGS', '').lower() == 'true'
+
 class DevelopmentConfig(Config):
     """Development configuration."""
     DEBUG = True
@@ -19,6 +28,14 @@ class ProductionConfig(Config):
     DEBUG = False
     # Ensure you set the DATABASE_URL environment variable in your production environment
     SQLALCHEMY_DATABASE_URI = os.environ.get('DATABASE_URL')
+    # Keep connections open between requests; the pool is per worker process,
+    # so size it against the database's max_connections
+    SQLALCHEMY_ENGINE_OPTIONS = {
+        'pool_size': int(os.environ.get('DB_POOL_SIZE', 25)),
+        'max_overflow': int(os.environ.get('DB_MAX_OVERFLOW', 25)),
+        'pool_pre_ping': True,
+        'pool_recycle': 1800,
+    }
 
 config = {
     'development': DevelopmentConfig,
@@ -1,7 +1,8 @@
 import os
 import click
 from app import create_app, db
-from app.models import User
+from sqlalchemy import func
+from app.models import User, Report, NewsArticle, Stat
 
 # Get the configuration name from the environment variable or use default
 config_name = os.getenv('FLASK_CONFIG') or 'default'
@@ -19,6 +20,15 @@ def create_admin(email):
     else:
         print(f"User with email {email} not found.")
 
+@app.cli.command("reconcile-stats")
+def reconcile_stats():
+    """Recounts reports and news articles into the stat table."""
+    for key, model in (('reports_count', Report), ('news_count', NewsArticle)):
+        count = db.session.query(func.count()).select_from(model).scalar()
+        db.session.merge(Stat(key=key, value=count))
+        print(f"{key} = {count}")
+    db.session.commit()
+
 
 if __name__ == '__main__':
     app.run(host='0.0.0.0', port=5000)
\ No newline at end of file